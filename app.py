@@ -11,8 +11,8 @@ from modules.chatbot import (
     limpar_memoria,
     obter_tamanho_memoria
 )
-from modules.rag_system import qa_chain, processar_todos_pdfs
-from utils.helpers import listar_pdfs
+from modules.rag_system import qa_chain, versao_rag, processar_todos_pdfs
+from utils.helpers import listar_pdfs, janela_mensagens, MENSAGENS_POR_PAGINA
 
 # ================= CONFIGURAÇÃO =================
 st.set_page_config(
@@ -21,6 +21,32 @@ st.set_page_config(
     layout="centered"
 )
 
+# ================= ESTADO DA SESSÃO =================
+if "messages" not in st.session_state:
+    st.session_state.messages = []
+
+if "limite_mensagens" not in st.session_state:
+    st.session_state.limite_mensagens = MENSAGENS_POR_PAGINA
+
+def carregar_documentos():
+    """
+    Retorna a lista de PDFs e o status do RAG guardados na sessão.
+    Só consulta o disco na primeira execução, depois de invalidar_documentos()
+    ou quando outra sessão reprocessa a base (versao_rag é global ao processo).
+    """
+    if st.session_state.get("versao_rag") != versao_rag:
+        invalidar_documentos()
+    if "pdfs" not in st.session_state:
+        st.session_state.pdfs = listar_pdfs()
+        st.session_state.rag_ativo = bool(qa_chain and st.session_state.pdfs)
+        st.session_state.versao_rag = versao_rag
+    return st.session_state.pdfs, st.session_state.rag_ativo
+
+def invalidar_documentos():
+    """Força uma nova leitura de data/docs na próxima chamada a carregar_documentos()."""
+    st.session_state.pop("pdfs", None)
+    st.session_state.pop("rag_ativo", None)
+
 # ================= CABEÇALHO =================
 st.title("🎓 Tutor Virtual Inteligente")
 st.write("Faça perguntas e receba respostas contextuais com memória de conversa.")
@@ -29,7 +55,7 @@ st.write("Faça perguntas e receba respostas contextuais com memória de convers
 with st.sidebar:
     st.header("📚 Documentos")
     
-    pdfs = listar_pdfs()
+    pdfs, rag_ativo = carregar_documentos()
     
     if not pdfs:
         st.warning("Adicione PDFs em `data/docs/`")
@@ -38,14 +64,26 @@ with st.sidebar:
         for pdf in pdfs:
             st.write(f"• {pdf}")
     
+    # Aviso do último processamento, guardado antes do st.rerun()
+    if "aviso_pdfs" in st.session_state:
+        tipo, texto = st.session_state.pop("aviso_pdfs")
+        getattr(st, tipo)(texto)
+    
     if st.button("🔄 Processar PDFs", type="secondary"):
+        # Reler a pasta para incluir PDFs adicionados durante a sessão
+        invalidar_documentos()
+        pdfs, rag_ativo = carregar_documentos()
         if pdfs:
             with st.spinner("Processando..."):
                 if processar_todos_pdfs():
-                    st.success("PDFs processados!")
-                    st.rerun()
+                    invalidar_documentos()
+                    st.session_state.aviso_pdfs = ("success", "PDFs processados!")
                 else:
-                    st.error("Erro no processamento")
+                    st.session_state.aviso_pdfs = ("error", "Erro no processamento")
+        else:
+            st.session_state.aviso_pdfs = ("warning", "Nenhum PDF encontrado em `data/docs/`")
+        # Redesenhar a lista a partir do estado relido
+        st.rerun()
     
     st.divider()
     
@@ -63,7 +101,7 @@ with st.sidebar:
         st.rerun()
     
     # Status RAG
-    if qa_chain and pdfs:
+    if rag_ativo:
         st.success("✅ RAG Ativo")
     else:
         st.warning("⚠️ RAG Inativo")
@@ -72,7 +110,7 @@ with st.sidebar:
 st.divider()
 
 # Seleção de modo
-if qa_chain and pdfs:
+if rag_ativo:
     modo = st.radio(
         "**Modo de resposta:**",
         ["Com base nos PDFs", "Chatbot com memória", "Chatbot básico"],
@@ -87,17 +125,26 @@ else:
         horizontal=True
     )
 
-# Inicializar histórico na session state
-if "messages" not in st.session_state:
-    st.session_state.messages = []
+# Exibir apenas a janela recente do histórico
+visiveis, ocultas = janela_mensagens(
+    st.session_state.messages,
+    st.session_state.limite_mensagens
+)
 
-# Exibir histórico
-for message in st.session_state.messages:
+if ocultas:
+    if st.button(f"⬆️ Carregar mensagens anteriores ({ocultas} ocultas)"):
+        st.session_state.limite_mensagens += MENSAGENS_POR_PAGINA
+        st.rerun()
+
+for message in visiveis:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
 
 # Input do usuário
 if pergunta := st.chat_input("Digite sua pergunta..."):
+    # Nova pergunta volta a janela para a página mais recente
+    st.session_state.limite_mensagens = MENSAGENS_POR_PAGINA
+
     # Adicionar pergunta ao histórico
     st.session_state.messages.append({"role": "user", "content": pergunta})
     
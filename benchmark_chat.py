@@ -0,0 +1,64 @@
+# benchmark_chat.py
+"""
+Mede o tempo de rerun do app.py em função do tamanho da conversa.
+
+Usa o AppTest do Streamlit para executar o próprio app.py, variando
+`limite_mensagens` na sessão:
+  - janela:   primeira página (MENSAGENS_POR_PAGINA), comportamento padrão
+  - paginado: depois de carregar duas páginas anteriores
+  - completo: histórico inteiro, equivalente à renderização sem janela
+
+Executar com:  python benchmark_chat.py
+"""
+
+import time
+from streamlit.testing.v1 import AppTest
+from utils.helpers import MENSAGENS_POR_PAGINA
+
+TAMANHOS = [10, 50, 100, 250, 500, 1000]
+REPETICOES = 5
+PAGINAS_CARREGADAS = 3
+
+
+def gerar_conversa(n):
+    """Gera n mensagens alternando aluno e tutor, com markdown típico de uma resposta."""
+    mensagens = []
+    for i in range(n):
+        if i % 2 == 0:
+            mensagens.append({"role": "user", "content": f"Pergunta {i}: o que é uma variável?"})
+        else:
+            mensagens.append({
+                "role": "assistant",
+                "content": (
+                    f"**Resposta {i}**\n\n"
+                    "Uma *variável* guarda um valor:\n\n"
+                    "```python\nx = 10\nprint(x)\n```\n\n"
+                    "- nome\n- tipo\n- valor"
+                ),
+            })
+    return mensagens
+
+
+def medir_rerun(n, limite):
+    """Retorna o tempo médio (ms) de um rerun do app.py com n mensagens e a janela dada."""
+    at = AppTest.from_file("app.py", default_timeout=120)
+    at.run()  # primeira execução paga imports, embeddings e leitura de data/docs
+
+    at.session_state["messages"] = gerar_conversa(n)
+    at.session_state["limite_mensagens"] = limite
+    at.run()
+
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        at.run()
+    return (time.perf_counter() - inicio) / REPETICOES * 1000
+
+
+if __name__ == "__main__":
+    print(f"{'mensagens':>10} | {'janela (ms)':>12} | {'paginado (ms)':>14} | {'completo (ms)':>14}")
+    print("-" * 60)
+    for n in TAMANHOS:
+        janela = medir_rerun(n, MENSAGENS_POR_PAGINA)
+        paginado = medir_rerun(n, MENSAGENS_POR_PAGINA * PAGINAS_CARREGADAS)
+        completo = medir_rerun(n, max(n, 1))
+        print(f"{n:>10} | {janela:>12.1f} | {paginado:>14.1f} | {completo:>14.1f}")
@@ -40,9 +40,12 @@ def load_llm(modelo: str = "Mistral"):
 class MemoriaConversa:
     def __init__(self):
         self.historico = []
+        self.interacoes = 0
     
     def adicionar_mensagem(self, role: str, content: str):
         self.historico.append({"role": role, "content": content})
+        if role == 'user':
+            self.interacoes += 1
     
     def obter_historico(self, limit=6):
         """Retorna as últimas mensagens (limit por role)"""
@@ -50,9 +53,11 @@ class MemoriaConversa:
     
     def limpar(self):
         self.historico = []
+        self.interacoes = 0
     
     def contar_interacoes(self):
-        return len([m for m in self.historico if m['role'] == 'user'])
+        """Contador mantido incrementalmente, barato de ler a cada rerun"""
+        return self.interacoes
 
 # Memória global
 memoria_simples = MemoriaConversa()
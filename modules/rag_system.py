@@ -22,6 +22,10 @@ load_dotenv()
 DOCS_PATH = "data/docs/"
 DB_PATH = "data/chroma_db/"
 
+# Incrementada sempre que a base ou o qa_chain mudam; o app compara com a
+# versão vista pela sessão para saber quando reler documentos e status do RAG
+versao_rag = 0
+
 def carregar_embeddings_locais():
     """Carrega modelo de embeddings local"""
     try:
@@ -197,8 +201,9 @@ def processar_todos_pdfs():
             print(f"🎉 {success_count}/{len(pdfs)} PDFs processados com sucesso!")
             
             # Recarregar sistema RAG
-            global qa_chain, vector_store
+            global qa_chain, vector_store, versao_rag
             qa_chain, vector_store = inicializar_sistema_rag()
+            versao_rag += 1
             
             return True
         else:
@@ -211,9 +216,11 @@ def processar_todos_pdfs():
 
 def limpar_base_conhecimento():
     """Limpa a base de dados"""
+    global versao_rag
     try:
         if os.path.exists(DB_PATH):
             shutil.rmtree(DB_PATH)
+            versao_rag += 1
             print("🧹 Base de conhecimento limpa")
             return True
         return False
@@ -5,6 +5,9 @@ Funções auxiliares corrigidas para paths do Windows
 
 import os
 
+# Mensagens exibidas por página do histórico do chat
+MENSAGENS_POR_PAGINA = 20
+
 def listar_pdfs(diretorio="data/docs"):
     """
     Lista todos os arquivos PDF dentro do diretório especificado.
@@ -28,4 +31,15 @@ def verificar_pdf_valido(caminho_pdf):
     """
     Verifica se um arquivo PDF existe e é válido.
     """
-    return os.path.exists(caminho_pdf) and os.path.isfile(caminho_pdf) and caminho_pdf.lower().endswith('.pdf')
\ No newline at end of file
+    return os.path.exists(caminho_pdf) and os.path.isfile(caminho_pdf) and caminho_pdf.lower().endswith('.pdf')
+
+def janela_mensagens(mensagens, limite):
+    """
+    Retorna as últimas `limite` mensagens do histórico e quantas ficaram ocultas.
+    Usado para exibir apenas uma janela recente da conversa.
+    """
+    if limite <= 0:
+        return [], len(mensagens)
+
+    ocultas = max(len(mensagens) - limite, 0)
+    return mensagens[ocultas:], ocultas